@@ -104,6 +104,14 @@ class Terminal(object):
 
         self.stream = stream
 
+        # Backing values for properties, filled in on first use and then
+        # reused. Properties can't be cached via setattr() the way __getattr__
+        # caches capabilities. This way, calling ``term.color(n)`` in a loop
+        # doesn't build a fresh ParametrizingString each time.
+        self._color = None
+        self._on_color = None
+        self._number_of_colors = None
+
     # Sugary names for commonly-used capabilities, intended to help avoid trips
     # to the terminfo man page and comments in your code:
     _sugar = dict(
@@ -258,14 +266,16 @@ class Terminal(object):
         movement.
 
         """
-        # Save position and move to the requested column, row, or both:
-        self.stream.write(self.save)
+        # Save position and move to the requested column, row, or both. Emit
+        # it all in one write so an unbuffered stream doesn't pay for two:
         if x is not None and y is not None:
-            self.stream.write(self.move(y, x))
+            self.stream.write(self.save + self.move(y, x))
         elif x is not None:
-            self.stream.write(self.move_x(x))
+            self.stream.write(self.save + self.move_x(x))
         elif y is not None:
-            self.stream.write(self.move_y(y))
+            self.stream.write(self.save + self.move_y(y))
+        else:
+            self.stream.write(self.save)
         try:
             yield
         finally:
@@ -304,7 +314,10 @@ class Terminal(object):
         :arg num: The number, 0-15, of the color
 
         """
-        return ParametrizingString(self._foreground_color, self.normal)
+        if self._color is None:
+            self._color = ParametrizingString(self._foreground_color,
+                                              self.normal)
+        return self._color
 
     @property
     def on_color(self):
@@ -313,7 +326,10 @@ class Terminal(object):
         See ``color()``.
 
         """
-        return ParametrizingString(self._background_color, self.normal)
+        if self._on_color is None:
+            self._on_color = ParametrizingString(self._background_color,
+                                                 self.normal)
+        return self._on_color
 
     @property
     def number_of_colors(self):
@@ -338,11 +354,13 @@ class Terminal(object):
         if not self._does_styling:
             return 0
 
-        colors = tigetnum('colors')  # Returns -1 if no color support, -2 if no
-                                     # such cap.
-        #  self.__dict__['colors'] = ret  # Cache it. It's not changing.
-                                          # (Doesn't work.)
-        return colors if colors >= 0 else 0
+        # Cache it. It's not changing. (Stuffing it into self.__dict__ doesn't
+        # work, since this is a property.)
+        if self._number_of_colors is None:
+            colors = tigetnum('colors')  # Returns -1 if no color support, -2
+                                         # if no such cap.
+            self._number_of_colors = colors if colors >= 0 else 0
+        return self._number_of_colors
 
     def _resolve_formatter(self, attr):
         """Resolve a sugary or plain capability name, color, or compound
@@ -362,8 +380,11 @@ class Terminal(object):
                 # It's a compound formatter, like "bold_green_on_red". Future
                 # optimization: combine all formatting into a single escape
                 # sequence.
+                #
+                # Go through getattr() so each part is resolved at most once
+                # per Terminal and shared with other compounds that use it.
                 return self._formatting_string(
-                    u''.join(self._resolve_formatter(s) for s in formatters))
+                    u''.join(getattr(self, s) for s in formatters))
             else:
                 return ParametrizingString(self._resolve_capability(attr))
 
@@ -388,12 +409,16 @@ class Terminal(object):
         # yellow when a terminal supports setf/setb rather than setaf/setab?
         # I'll be blasted if I can find any documentation. The following
         # assumes it does.
-        color_cap = (self._background_color if 'on_' in color else
-                     self._foreground_color)
+        #
+        # Go through color() and on_color() so named colors share their
+        # parametrization cache with numeric ones.
+        color_cap = self.on_color if 'on_' in color else self.color
         # curses constants go up to only 7, so add an offset to get at the
         # bright colors at 8-15:
         offset = 8 if 'bright_' in color else 0
         base_color = color.rsplit('_', 1)[-1]
+        # color() returns a plain Unicode if tparm() fails; keep the result
+        # callable regardless.
         return self._formatting_string(
             color_cap(getattr(curses, 'COLOR_' + base_color.upper()) + offset))
 
@@ -426,12 +451,22 @@ DUALS = {
     'underline', 'italic', 'shadow', 'standout', 'subscript', 'superscript'
 }
 COMPOUNDABLES = (COLORS | SINGLES | DUALS | {'no_' + c for c in DUALS})
+# These occur only as prefixes, so split_into_formatters() can always merge
+# them with the following segment:
+MERGEABLE_PREFIXES = frozenset(['no', 'on', 'bright', 'on_bright'])
 
 
 class ParametrizingString(text_type):
     """A Unicode string which can be called to parametrize it as a terminal
     capability"""
 
+    # The most parametrizations to remember per capability. cup can take
+    # height * width distinct args, so this is sized to hold every cell of a
+    # large terminal (300x100 is 30,000) at a cost of a few MB at most. Past
+    # that we clear the cache and start over. That is cheaper on every hit than
+    # LRU bookkeeping, at the price of a burst of misses after each clear.
+    _max_cached = 2 ** 15
+
     def __new__(cls, formatting, normal=None):
         """Instantiate.
 
@@ -442,9 +477,23 @@ class ParametrizingString(text_type):
         """
         new = text_type.__new__(cls, formatting)
         new._normal = normal
+        # Results of earlier parametrizations, keyed by args. tparm() is a pure
+        # function of the template and its args, and things like move(y, x)
+        # tend to get called with the same args over and over.
+        new._parametrized = {}
+        new._encoded = None  # The template as tparm() wants it; see __call__.
         return new
 
     def __call__(self, *args):
+        # Only plain ints go through the cache. Other args, like 3.0, would
+        # hash and compare equal to cached ints and skip the TypeError that
+        # tparm() raises for them.
+        cacheable = all(type(arg) is int for arg in args)
+        if cacheable:
+            try:
+                return self._parametrized[args]
+            except KeyError:
+                pass
         try:
             # Re-encode the cap, because tparm() takes a bytestring in Python
             # 3. However, appear to be a plain Unicode string otherwise so
@@ -457,9 +506,18 @@ class ParametrizingString(text_type):
             # unicode byte values. The terminal emulator will "catch" and
             # handle these values, even if emitting utf8-encoded text, where
             # these bytes would otherwise be illegal utf8 start bytes.
-            parametrized = tparm(self.encode('latin1'), *args).decode('latin1')
-            return (parametrized if self._normal is None else
-                    FormattingString(parametrized, self._normal))
+            #
+            # The encoded template never changes, so do that only once.
+            if self._encoded is None:
+                self._encoded = self.encode('latin1')
+            parametrized = tparm(self._encoded, *args).decode('latin1')
+            result = (parametrized if self._normal is None else
+                      FormattingString(parametrized, self._normal))
+            if cacheable:
+                if len(self._parametrized) >= self._max_cached:
+                    self._parametrized.clear()
+                self._parametrized[args] = result
+            return result
         except curses.error:
             # Catch "must call (at least) setupterm() first" errors, as when
             # running simply `nosetests` (without progressive) on nose-
@@ -497,7 +555,9 @@ class FormattingString(text_type):
         back to defaults. The return value is always a Unicode.
 
         """
-        return self + text + self._normal
+        # One join rather than two concatenations, which would build and throw
+        # away an intermediate string:
+        return u''.join((self, text, self._normal))
 
 
 class NullCallableString(text_type):
@@ -554,10 +614,8 @@ def split_into_formatters(compound):
     ['red', 'no_italic', 'shadow', 'on_bright_cyan']
     """
     merged_segs = []
-    # These occur only as prefixes, so they can always be merged:
-    mergeable_prefixes = ['no', 'on', 'bright', 'on_bright']
     for s in compound.split('_'):
-        if merged_segs and merged_segs[-1] in mergeable_prefixes:
+        if merged_segs and merged_segs[-1] in MERGEABLE_PREFIXES:
             merged_segs[-1] += '_' + s
         else:
             merged_segs.append(s)
@@ -9,6 +9,7 @@ All we require from the host machine is that a standard terminfo definition of
 xterm-256color exists.
 
 """
+import curses
 from curses import tigetstr, tparm
 from functools import partial
 import sys
@@ -20,6 +21,8 @@ from six import StringIO
 # This tests that __all__ is correct, since we use below everything that should
 # be imported:
 from blessings import *
+import blessings
+from blessings import ParametrizingString
 
 
 TestTerminal = partial(Terminal, kind='xterm-256color')
@@ -67,6 +70,56 @@ def test_parametrization():
     eq_(TestTerminal().cup(3, 4), unicode_parm('cup', 3, 4))
 
 
+def test_parametrization_caching():
+    """Parametrizing with the same args twice should give the same string,
+    and different args should still give different strings."""
+    t = TestTerminal()
+    eq_(t.move(3, 4), unicode_parm('cup', 3, 4))
+    assert (3, 4) in t.move._parametrized
+    assert t.move(3, 4) is t.move(3, 4)  # Now from the cache
+    eq_(t.move(4, 3), unicode_parm('cup', 4, 3))
+    eq_(t.color(5)('smoo'), t.color(5) + 'smoo' + t.normal)
+
+
+def test_parametrization_cache_ignores_non_ints():
+    """A cached int result shouldn't leak out for an equal float, which
+    tparm() would reject."""
+    t = TestTerminal()
+    eq_(t.move_x(3), unicode_parm('hpa', 3))
+    try:
+        t.move_x(3.0)
+    except TypeError:
+        pass
+    else:
+        assert False, 'move_x(3.0) should raise TypeError.'
+    eq_([type(k[0]) for k in t.move_x._parametrized], [int])
+
+
+def test_failed_parametrization_not_cached():
+    """If tparm() fails, don't remember the blank result."""
+    def failing_tparm(*args):
+        raise curses.error('must call (at least) setupterm() first')
+
+    cap = TestTerminal().move
+    real_tparm = blessings.tparm
+    blessings.tparm = failing_tparm
+    try:
+        eq_(cap(3, 4), u'')
+    finally:
+        blessings.tparm = real_tparm
+    assert (3, 4) not in cap._parametrized
+    eq_(cap(3, 4), unicode_parm('cup', 3, 4))
+
+
+def test_parametrization_cache_is_bounded():
+    """The parametrization cache shouldn't grow without limit."""
+    t = TestTerminal()
+    for x in range(ParametrizingString._max_cached + 10):
+        t.move_x(x)
+    assert len(t.move_x._parametrized) <= ParametrizingString._max_cached
+    eq_(t.move_x(3), unicode_parm('hpa', 3))
+
+
 def test_height_and_width():
     """Assert that ``height_and_width()`` returns ints."""
     t = TestTerminal()  # kind shouldn't matter.
@@ -122,6 +175,22 @@ def test_zero_location():
                              unicode_cap('rc'))
 
 
+def test_location_writes_once_on_entry():
+    """``location()`` should save and move the cursor in a single write."""
+    class CountingStringIO(StringIO):
+        writes = 0
+
+        def write(self, s):
+            self.writes += 1
+            return StringIO.write(self, s)
+
+    for kwargs in [dict(x=3, y=4), dict(x=3), dict(y=4), {}]:
+        t = TestTerminal(stream=CountingStringIO(), force_styling=True)
+        with t.location(**kwargs):
+            eq_(t.stream.writes, 1)
+        eq_(t.stream.writes, 2)
+
+
 def test_null_fileno():
     """Make sure ``Terminal`` works when ``fileno`` is ``None``.
 
@@ -164,6 +233,15 @@ def test_callable_numeric_colors():
     eq_(t.on_color(2)('smoo'), t.on_color(2) + 'smoo' + t.normal)
 
 
+def test_color_caps_are_reused():
+    """``color`` and ``on_color`` should be built once per Terminal."""
+    t = TestTerminal()
+    assert t.color is t.color
+    assert t.on_color is t.on_color
+    eq_(t.color(5), unicode_parm('setaf', 5))
+    eq_(t.on_color(5), unicode_parm('setab', 5))
+
+
 def test_null_callable_numeric_colors():
     """``color(n)`` should be a no-op on null terminals."""
     t = TestTerminal(stream=StringIO())
@@ -195,6 +273,31 @@ def test_number_of_colors_with_tty():
     eq_(t.number_of_colors, 256)
 
 
+def test_number_of_colors_is_cached():
+    """``number_of_colors`` should ask terminfo only once per Terminal, and
+    not at all when we aren't styling."""
+    calls = []
+
+    def counting_tigetnum(cap):
+        calls.append(cap)
+        return real_tigetnum(cap)
+
+    real_tigetnum = blessings.tigetnum
+    blessings.tigetnum = counting_tigetnum
+    try:
+        t = TestTerminal()
+        eq_(t.number_of_colors, 256)
+        eq_(t.number_of_colors, 256)
+        eq_(calls, ['colors'])
+
+        t = TestTerminal(force_styling=None)
+        eq_(t.number_of_colors, 0)
+        eq_(t._number_of_colors, None)
+        eq_(calls, ['colors'])
+    finally:
+        blessings.tigetnum = real_tigetnum
+
+
 def test_formatting_functions():
     """Test crazy-ass formatting wrappers, both simple and compound."""
     t = TestTerminal()
@@ -218,6 +321,15 @@ def test_formatting_functions():
         u'meh' + t.normal)
 
 
+def test_compound_formatters_reuse_parts():
+    """Resolving a compound formatter should cache its parts, too."""
+    t = TestTerminal()
+    eq_(t.bold_green_on_red('boo'),
+        t.bold + t.green + t.on_red + u'boo' + t.normal)
+    assert 'on_red' in vars(t)  # Cached by resolving the compound
+    eq_(t.underline_on_red, t.underline + t.on_red)
+
+
 def test_formatting_functions_without_tty():
     """Test crazy-ass formatting wrappers when there's no tty."""
     t = TestTerminal(stream=StringIO())